@@ -1,14 +1,90 @@
 """File and folder renaming according to Plex guidelines."""
 
 import logging
+import os
 import re
+import stat
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
 
 from .classify import MediaType
 
 logger = logging.getLogger(__name__)
 
+# Tuple rather than set so it can be passed straight to str.endswith
+_VIDEO_EXTS = (".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv", ".webm", ".m4v")
+
+# TV show name patterns, combined into one anchored alternation. Alternatives are
+# tried in order, so earlier patterns take priority just as sequential searches
+# would. Each alternative is wrapped in a pN group so match.lastgroup names the
+# pattern that matched.
+_TV_PATTERNS = re.compile(
+    r"^(?:"
+    # Pattern 1: Show Name (Year) S04E02
+    r"(?P<p1>(?P<title1>.+?)\s*\(\d{4}\)\s+S(?P<season1>\d+)E\d+)"
+    # Pattern 2: Show Name S04E02
+    r"|(?P<p2>(?P<title2>.+?)\s+S(?P<season2>\d+)E\d+)"
+    # Pattern 3: Show Name Season X
+    r"|(?P<p3>(?P<title3>.+?)\s+season\s+(?P<season3>\d+))"
+    # Pattern 4: Show Name SX
+    r"|(?P<p4>(?P<title4>.+?)\s+s(?P<season4>\d+))"
+    # Pattern 5: Show Name (Year) Season X
+    r"|(?P<p5>(?P<title5>.+?)\s*\(\d{4}\)\s*season\s+(?P<season5>\d+))"
+    r")",
+    re.IGNORECASE,
+)
+# Every TV pattern needs a digit; names without one skip the combined match,
+# whose lazy title groups backtrack through the whole name before failing
+_DIGIT = re.compile(r"\d")
+_TV_TRAILING_JUNK = re.compile(r"\s*(?:complete|series|collection).*$", re.IGNORECASE)
+
+# Movie name patterns. The year patterns match only the year part and are searched
+# from position 1; the title is the text before the match. This is equivalent to
+# a ^(.+?) title prefix without backtracking through every possible title length.
+_MOVIE_YEAR_PAREN = re.compile(r"\s*\((\d{4})\)")
+_MOVIE_YEAR_BARE = re.compile(r"\s+(\d{4})(?:\s|$)")
+# Bracketed content and trailing release info, stripped in a single pass
+_MOVIE_JUNK = re.compile(
+    r"\s*[\[\(][^\]\)\n]*[\]\)]|\s*(?:bluray|dvdrip|webrip|hdtv|1080p|720p|4k).*$",
+    re.IGNORECASE,
+)
+
+# Audiobook name patterns
+_BY_SEPARATOR = re.compile(r"\s+by\s+", re.IGNORECASE)
+
+# Episode patterns
+_EPISODE_SXXEXX = re.compile(r"S(\d+)E(\d+)", re.IGNORECASE)
+_EPISODE_NXN = re.compile(r"(\d+)x(\d+)", re.IGNORECASE)
+_EPISODE_TITLE = re.compile(r"^\s*([^\(\[]+)")
+_RELEASE_TAGS = re.compile(
+    r"\s*(?:1080p|720p|x264|x265|bluray|webrip|hdtv).*$", re.IGNORECASE
+)
+
+# Title cleanup patterns
+_BRACKETS = re.compile(r"\s*[\[\(][^\]\)\n]*[\]\)]")
+# Common release info, combined into one alternation so it is a single pass
+_JUNK = re.compile(
+    r"\b(?:"
+    r"bluray|blu-ray|dvdrip|webrip|hdtv|pdtv|hdcam|cam|ts|tc"
+    r"|1080p|720p|480p|4k|uhd|2160p"
+    r"|x264|x265|h264|h265|hevc|xvid|divx"
+    r"|aac|ac3|dts|mp3|flac"
+    r"|proper|repack|internal|limited|extended|unrated|directors|cut"
+    r"|complete|collection|series|season|s\d+"
+    r"|www\.\w+\.\w+"  # Website names
+    r")\b",
+    re.IGNORECASE,
+)
+
+
+class EpisodeInfo(NamedTuple):
+    """Episode information parsed from a filename."""
+
+    season: Optional[int]
+    episode: Optional[int]
+    title: Optional[str]
+
 
 def get_renamed_path(
     folder_path: Path, media_type: str, config: Dict[str, Any]
@@ -24,107 +100,111 @@ def get_renamed_path(
     Returns:
         Destination path or None if renaming fails
     """
-    dest_dir = Path(config["dest_dir"])
+    renamer = _RENAMERS.get(media_type)
+    if renamer is None:
+        logger.warning("Unknown media type for renaming: %s", media_type)
+        return None
 
-    try:
-        if media_type == MediaType.TV:
-            return _rename_tv_show(folder_path, dest_dir, config)
-        elif media_type == MediaType.MOVIE:
-            return _rename_movie(folder_path, dest_dir, config)
-        elif media_type == MediaType.MUSIC:
-            return _rename_music(folder_path, dest_dir, config)
-        elif media_type == MediaType.AUDIOBOOK:
-            return _rename_audiobook(folder_path, dest_dir, config)
-        else:
-            logger.warning(f"Unknown media type for renaming: {media_type}")
-            return None
+    category, rename = renamer
+    category_dir = _category_dir(str(config["dest_dir"]), category)
 
+    try:
+        return rename(folder_path, category_dir, config)
     except Exception as e:
-        logger.error(f"Error renaming {folder_path}: {e}")
+        logger.error("Error renaming %s: %s", folder_path, e)
         return None
 
 
-def _rename_tv_show(folder_path: Path, dest_dir: Path, config: Dict[str, Any]) -> Path:
+@lru_cache(maxsize=64)
+def _category_dir(dest_dir: str, category: str) -> str:
+    """Build the root folder for a media category in dest_dir."""
+    return os.path.join(dest_dir, category)
+
+
+def _rename_tv_show(folder_path: Path, tv_dir: str, config: Dict[str, Any]) -> Path:
     """Rename TV show according to Plex guidelines."""
     folder_name = folder_path.name
 
-    # Check if source is a file or folder
-    is_file = folder_path.is_file()
+    # Check if source is a file or folder with a single stat call
+    try:
+        mode = folder_path.stat().st_mode
+    except OSError:
+        mode = 0  # Missing or inaccessible: neither a file nor a folder
+    is_file = stat.S_ISREG(mode)
 
     # Check if this is a folder containing a single video file (episode folder)
     is_episode_folder = False
-    if not is_file and folder_path.is_dir():
+    if stat.S_ISDIR(mode):
         try:
-            video_extensions = {
-                ".mp4",
-                ".mkv",
-                ".avi",
-                ".mov",
-                ".wmv",
-                ".flv",
-                ".webm",
-                ".m4v",
-            }
-            video_files = [
-                f
-                for f in folder_path.iterdir()
-                if f.is_file() and f.suffix.lower() in video_extensions
-            ]
-            if len(video_files) == 1:
+            # scandir reports file types from the directory read, avoiding a
+            # stat call per entry; only the count matters, so stop at the second
+            # video file
+            video_count = 0
+            video_name = None
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    if entry.name.lower().endswith(_VIDEO_EXTS) and entry.is_file():
+                        video_count += 1
+                        if video_count > 1:
+                            break
+                        video_name = entry.name
+            if video_count == 1:
                 is_episode_folder = True
                 logger.debug(
-                    f"Detected episode folder with single video file: {video_files[0].name}"
+                    "Detected episode folder with single video file: %s", video_name
                 )
         except (PermissionError, OSError):
             pass
 
     logger.debug(
-        f"Processing TV show: {folder_name}, is_file: {is_file}, is_episode_folder: {is_episode_folder}"
+        "Processing TV show: %s, is_file: %s, is_episode_folder: %s",
+        folder_name,
+        is_file,
+        is_episode_folder,
     )
 
     # Extract show title and season
     title, season = _parse_tv_show_name(folder_name)
-    logger.debug(f"Parsed title: '{title}', season: {season}")
+    logger.debug("Parsed title: '%s', season: %s", title, season)
 
     if not title:
         # Fallback to original name
         title = _clean_title(folder_name)
-        logger.debug(f"Using fallback title: '{title}'")
+        logger.debug("Using fallback title: '%s'", title)
 
     # Create destination path: TV Shows/Show Name/Season XX/
-    tv_dir = dest_dir / "TV Shows"
-    show_dir = tv_dir / title
+    show_dir = os.path.join(tv_dir, title)
 
     if season is not None:
-        season_dir = show_dir / f"Season {season:02d}"
+        season_dir = os.path.join(show_dir, f"Season {season:02d}")
 
         # If source is a file or episode folder, generate the complete file path
         if is_file or is_episode_folder:
             # Parse episode info and create Plex-compliant filename
             episode_filename = _generate_episode_filename(folder_name, title, season)
-            logger.debug(f"Generated episode filename: '{episode_filename}'")
-            final_path = season_dir / episode_filename
-            logger.debug(f"Final file path: {final_path}")
-            return final_path
+            logger.debug("Generated episode filename: '%s'", episode_filename)
+            final_path = os.path.join(season_dir, episode_filename)
+            logger.debug("Final file path: %s", final_path)
+            return Path(final_path)
         else:
-            logger.debug(f"Returning season directory: {season_dir}")
-            return season_dir
+            logger.debug("Returning season directory: %s", season_dir)
+            return Path(season_dir)
     else:
         # If source is a file or episode folder without season info, put in show directory
         if is_file or is_episode_folder:
             episode_filename = _generate_episode_filename(folder_name, title, None)
             logger.debug(
-                f"Generated episode filename (no season): '{episode_filename}'"
+                "Generated episode filename (no season): '%s'", episode_filename
             )
-            final_path = show_dir / episode_filename
-            logger.debug(f"Final file path (no season): {final_path}")
-            return final_path
+            final_path = os.path.join(show_dir, episode_filename)
+            logger.debug("Final file path (no season): %s", final_path)
+            return Path(final_path)
         else:
-            logger.debug(f"Returning show directory: {show_dir}")
-            return show_dir
+            logger.debug("Returning show directory: %s", show_dir)
+            return Path(show_dir)
 
 
-def _rename_movie(folder_path: Path, dest_dir: Path, config: Dict[str, Any]) -> Path:
+def _rename_movie(folder_path: Path, movies_dir: str, config: Dict[str, Any]) -> Path:
     """Rename movie according to Plex guidelines."""
     folder_name = folder_path.name
 
@@ -135,17 +215,15 @@ def _rename_movie(folder_path: Path, dest_dir: Path, config: Dict[str, Any]) ->
         title = _clean_title(folder_name)
 
     # Create destination path: Movies/Title (Year)/
-    movies_dir = dest_dir / "Movies"
-
     if year:
-        movie_dir = movies_dir / f"{title} ({year})"
+        movie_dir = os.path.join(movies_dir, f"{title} ({year})")
     else:
-        movie_dir = movies_dir / title
+        movie_dir = os.path.join(movies_dir, title)
 
-    return movie_dir
+    return Path(movie_dir)
 
 
-def _rename_music(folder_path: Path, dest_dir: Path, config: Dict[str, Any]) -> Path:
+def _rename_music(folder_path: Path, music_dir: str, config: Dict[str, Any]) -> Path:
     """Rename music according to common organization."""
     folder_name = folder_path.name
 
@@ -158,15 +236,11 @@ def _rename_music(folder_path: Path, dest_dir: Path, config: Dict[str, Any]) ->
         album = _clean_title(folder_name)
 
     # Create destination path: Music/Artist/Album/
-    music_dir = dest_dir / "Music"
-    artist_dir = music_dir / artist
-    album_dir = artist_dir / album
-
-    return album_dir
+    return Path(os.path.join(music_dir, artist, album))
 
 
 def _rename_audiobook(
-    folder_path: Path, dest_dir: Path, config: Dict[str, Any]
+    folder_path: Path, audiobook_dir: str, config: Dict[str, Any]
 ) -> Path:
     """Rename audiobook according to common organization."""
     folder_name = folder_path.name
@@ -180,147 +254,121 @@ def _rename_audiobook(
         title = _clean_title(folder_name)
 
     # Create destination path: Audiobooks/Author/Title/
-    audiobook_dir = dest_dir / "Audiobooks"
-    author_dir = audiobook_dir / author
-    title_dir = author_dir / title
+    return Path(os.path.join(audiobook_dir, author, title))
+
 
-    return title_dir
+# Media type -> (category folder, renamer) used by get_renamed_path
+_RENAMERS: Dict[str, Tuple[str, Callable[[Path, str, Dict[str, Any]], Path]]] = {
+    MediaType.TV: ("TV Shows", _rename_tv_show),
+    MediaType.MOVIE: ("Movies", _rename_movie),
+    MediaType.MUSIC: ("Music", _rename_music),
+    MediaType.AUDIOBOOK: ("Audiobooks", _rename_audiobook),
+}
 
 
+@lru_cache(maxsize=4096)
 def _parse_tv_show_name(folder_name: str) -> Tuple[Optional[str], Optional[int]]:
     """Parse TV show name to extract title and season number."""
     folder_name = folder_name.strip()
-    logger.debug(f"Parsing TV show name: '{folder_name}'")
-
-    # Pattern 1: Show Name (Year) S04E02 format
-    pattern1 = re.search(
-        r"^(.+?)\s*\((\d{4})\)\s+S(\d+)E\d+", folder_name, re.IGNORECASE
-    )
-    if pattern1:
-        title = pattern1.group(1).strip()
-        season = int(pattern1.group(3))
-        logger.debug(f"Pattern 1 matched - title: '{title}', season: {season}")
-        return _clean_title(title), season
-
-    # Pattern 2: Show Name S04E02 format (without year)
-    pattern2 = re.search(r"^(.+?)\s+S(\d+)E\d+", folder_name, re.IGNORECASE)
-    if pattern2:
-        title = pattern2.group(1).strip()
-        season = int(pattern2.group(2))
-        logger.debug(f"Pattern 2 matched - title: '{title}', season: {season}")
-        return _clean_title(title), season
-
-    # Pattern 3: Show Name Season X
-    pattern3 = re.search(r"^(.+?)\s+season\s+(\d+)", folder_name, re.IGNORECASE)
-    if pattern3:
-        title = pattern3.group(1).strip()
-        season = int(pattern3.group(2))
-        logger.debug(f"Pattern 3 matched - title: '{title}', season: {season}")
-        return _clean_title(title), season
-
-    # Pattern 4: Show Name SX (without episode)
-    pattern4 = re.search(r"^(.+?)\s+s(\d+)", folder_name, re.IGNORECASE)
-    if pattern4:
-        title = pattern4.group(1).strip()
-        season = int(pattern4.group(2))
-        logger.debug(f"Pattern 4 matched - title: '{title}', season: {season}")
-        return _clean_title(title), season
-
-    # Pattern 5: Show Name (Year) Season X
-    pattern5 = re.search(
-        r"^(.+?)\s*\(\d{4}\)\s*season\s+(\d+)", folder_name, re.IGNORECASE
-    )
-    if pattern5:
-        title = pattern5.group(1).strip()
-        season = int(pattern5.group(2))
-        logger.debug(f"Pattern 5 matched - title: '{title}', season: {season}")
+    logger.debug("Parsing TV show name: '%s'", folder_name)
+
+    # Patterns 1-5: title with season info, matched in a single scan
+    match = _TV_PATTERNS.match(folder_name) if _DIGIT.search(folder_name) else None
+    if match:
+        number = (match.lastgroup or "")[1:]  # "p3" -> "3"
+        title = match.group(f"title{number}").strip()
+        season = int(match.group(f"season{number}"))
+        logger.debug(
+            "Pattern %s matched - title: '%s', season: %s", number, title, season
+        )
         return _clean_title(title), season
 
     # Pattern 6: Just show name (no season info)
     # Remove common junk at the end
-    clean_name = re.sub(r"\s*[\[\(].*?[\]\)]", "", folder_name)
-    clean_name = re.sub(
-        r"\s*(complete|series|collection).*$", "", clean_name, flags=re.IGNORECASE
-    )
-    logger.debug(f"No pattern matched, using cleaned name: '{clean_name}'")
+    clean_name = _BRACKETS.sub("", folder_name)
+    clean_name = _TV_TRAILING_JUNK.sub("", clean_name)
+    logger.debug("No pattern matched, using cleaned name: '%s'", clean_name)
 
     return _clean_title(clean_name), None
 
 
+@lru_cache(maxsize=4096)
 def _parse_movie_name(folder_name: str) -> Tuple[Optional[str], Optional[int]]:
     """Parse movie name to extract title and year."""
     folder_name = folder_name.strip()
 
     # Pattern 1: Title (Year)
-    pattern1 = re.search(r"^(.+?)\s*\((\d{4})\)", folder_name)
+    pattern1 = _MOVIE_YEAR_PAREN.search(folder_name, 1)
     if pattern1:
-        title = pattern1.group(1).strip()
-        year = int(pattern1.group(2))
+        title = folder_name[: pattern1.start()].strip()
+        year = int(pattern1.group(1))
         return _clean_title(title), year
 
     # Pattern 2: Title Year (without parentheses)
-    pattern2 = re.search(r"^(.+?)\s+(\d{4})(?:\s|$)", folder_name)
+    pattern2 = _MOVIE_YEAR_BARE.search(folder_name, 1)
     if pattern2:
-        title = pattern2.group(1).strip()
-        year = int(pattern2.group(2))
+        title = folder_name[: pattern2.start()].strip()
+        year = int(pattern2.group(1))
         return _clean_title(title), year
 
     # Pattern 3: Just title (no year)
-    clean_name = re.sub(r"\s*[\[\(].*?[\]\)]", "", folder_name)
-    clean_name = re.sub(
-        r"\s*(bluray|dvdrip|webrip|hdtv|1080p|720p|4k).*$",
-        "",
-        clean_name,
-        flags=re.IGNORECASE,
-    )
+    clean_name = _MOVIE_JUNK.sub("", folder_name)
 
     return _clean_title(clean_name), None
 
 
+@lru_cache(maxsize=4096)
 def _parse_music_name(folder_name: str) -> Tuple[Optional[str], Optional[str]]:
     """Parse music folder name to extract artist and album."""
     folder_name = folder_name.strip()
 
     # Pattern 1: Artist - Album
-    pattern1 = re.match(r"^(.+?)\s*-\s*(.+?)$", folder_name)
-    if pattern1:
-        artist = pattern1.group(1).strip()
-        album = pattern1.group(2).strip()
+    pair = _split_pair(folder_name, "-")
+    if pair:
+        artist, album = pair
         return _clean_title(artist), _clean_title(album)
 
     # Pattern 2: Artist_Album or Artist.Album
-    pattern2 = re.match(r"^(.+?)[._](.+?)$", folder_name)
-    if pattern2:
-        artist = pattern2.group(1).strip()
-        album = pattern2.group(2).strip()
+    pair = _split_pair(folder_name, "._")
+    if pair:
+        artist, album = pair
         return _clean_title(artist), _clean_title(album)
 
     # Pattern 3: Just album name
     return None, _clean_title(folder_name)
 
 
+@lru_cache(maxsize=4096)
 def _parse_audiobook_name(folder_name: str) -> Tuple[Optional[str], Optional[str]]:
     """Parse audiobook folder name to extract author and title."""
     folder_name = folder_name.strip()
 
     # Pattern 1: Author - Title
-    pattern1 = re.match(r"^(.+?)\s*-\s*(.+?)$", folder_name)
-    if pattern1:
-        author = pattern1.group(1).strip()
-        title = pattern1.group(2).strip()
+    pair = _split_pair(folder_name, "-")
+    if pair:
+        author, title = pair
         return _clean_title(author), _clean_title(title)
 
-    # Pattern 2: Title by Author
-    pattern2 = re.search(r"^(.+?)\s+by\s+(.+?)$", folder_name, re.IGNORECASE)
-    if pattern2:
-        title = pattern2.group(1).strip()
-        author = pattern2.group(2).strip()
+    # Pattern 2: Title by Author (searching from 1 so the title is non-empty)
+    by_match = _BY_SEPARATOR.search(folder_name, 1)
+    if by_match:
+        title = folder_name[: by_match.start()].strip()
+        author = folder_name[by_match.end() :].strip()
         return _clean_title(author), _clean_title(title)
 
     # Pattern 3: Just title
     return None, _clean_title(folder_name)
 
 
+def _split_pair(name: str, separators: str) -> Optional[Tuple[str, str]]:
+    """Split name at the first separator with text on both sides."""
+    positions = [name.find(separator, 1) for separator in separators]
+    index = min((position for position in positions if position > 0), default=-1)
+    if index == -1 or index == len(name) - 1:
+        return None
+    return name[:index].strip(), name[index + 1 :].strip()
+
+
 def _generate_episode_filename(
     original_name: str, show_title: str, season: Optional[int]
 ) -> str:
@@ -328,20 +376,21 @@ def _generate_episode_filename(
     # Extract episode information
     episode_info = _parse_episode_info(original_name)
 
-    # Get file extension from original
-    original_path = Path(original_name)
-    extension = original_path.suffix or ".mkv"  # Default to .mkv if no extension
+    # Get file extension from original (same rules as Path.suffix)
+    dot = original_name.rfind(".")
+    if 0 < dot < len(original_name) - 1:
+        extension = original_name[dot:]
+    else:
+        extension = ".mkv"  # Default to .mkv if no extension
 
     # Generate clean show title for filename
     clean_show = show_title.replace(" ", ".")
 
-    if episode_info["season"] is not None and episode_info["episode"] is not None:
+    if episode_info.season is not None and episode_info.episode is not None:
         # Format: Show.Name.S01E01.Episode.Title.ext
-        filename = (
-            f"{clean_show}.S{episode_info['season']:02d}E{episode_info['episode']:02d}"
-        )
-        if episode_info["title"]:
-            clean_episode_title = episode_info["title"].replace(" ", ".")
+        filename = f"{clean_show}.S{episode_info.season:02d}E{episode_info.episode:02d}"
+        if episode_info.title:
+            clean_episode_title = episode_info.title.replace(" ", ".")
             filename += f".{clean_episode_title}"
         filename += extension
     elif season is not None:
@@ -355,67 +404,62 @@ def _generate_episode_filename(
     return filename
 
 
-def _parse_episode_info(filename: str) -> Dict[str, Optional[Any]]:
+@lru_cache(maxsize=4096)
+def _parse_episode_info(filename: str) -> EpisodeInfo:
     """Parse episode information from filename."""
-    result: Dict[str, Optional[Any]] = {"season": None, "episode": None, "title": None}
+    season: Optional[int] = None
+    episode: Optional[int] = None
+    title: Optional[str] = None
 
     # Pattern 1: S04E02 format
-    pattern1 = re.search(r"S(\d+)E(\d+)", filename, re.IGNORECASE)
+    pattern1 = _EPISODE_SXXEXX.search(filename)
     if pattern1:
-        result["season"] = int(pattern1.group(1))
-        result["episode"] = int(pattern1.group(2))
+        season = int(pattern1.group(1))
+        episode = int(pattern1.group(2))
 
         # Try to extract episode title after the episode number
         after_episode = filename[pattern1.end() :]
-        title_match = re.search(r"^\s*([^\(\[]+)", after_episode)
+        title_match = _EPISODE_TITLE.search(after_episode)
         if title_match:
-            title = title_match.group(1).strip()
-            title = re.sub(
-                r"\s*(1080p|720p|x264|x265|bluray|webrip|hdtv).*$",
-                "",
-                title,
-                flags=re.IGNORECASE,
-            )
-            result["title"] = _clean_title(title) if title else None
+            raw_title = title_match.group(1).strip()
+            raw_title = _RELEASE_TAGS.sub("", raw_title)
+            title = _clean_title(raw_title) if raw_title else None
 
     # Pattern 2: 4x02 format
-    pattern2 = re.search(r"(\d+)x(\d+)", filename, re.IGNORECASE)
-    if pattern2 and not result["season"]:
-        result["season"] = int(pattern2.group(1))
-        result["episode"] = int(pattern2.group(2))
+    pattern2 = _EPISODE_NXN.search(filename)
+    if pattern2 and not season:
+        season = int(pattern2.group(1))
+        episode = int(pattern2.group(2))
 
-    return result
+    return EpisodeInfo(season, episode, title)
 
 
+@lru_cache(maxsize=4096)
 def _clean_title(title: str) -> str:
     """Clean up title by removing common junk."""
     if not title:
         return "Unknown"
 
     # Remove bracketed content
-    title = re.sub(r"\s*[\[\(].*?[\]\)]", "", title)
+    title = _BRACKETS.sub("", title)
 
     # Remove common release info
-    junk_patterns = [
-        r"\b(bluray|blu-ray|dvdrip|webrip|hdtv|pdtv|hdcam|cam|ts|tc)\b",
-        r"\b(1080p|720p|480p|4k|uhd|2160p)\b",
-        r"\b(x264|x265|h264|h265|hevc|xvid|divx)\b",
-        r"\b(aac|ac3|dts|mp3|flac)\b",
-        r"\b(proper|repack|internal|limited|extended|unrated|directors|cut)\b",
-        r"\b(complete|collection|series|season|s\d+)\b",
-        r"\b(www\.\w+\.\w+)\b",  # Remove website names
-    ]
-
-    for pattern in junk_patterns:
-        title = re.sub(pattern, "", title, flags=re.IGNORECASE)
+    title = _JUNK.sub("", title)
 
     # Remove multiple spaces and clean up
-    title = re.sub(r"\s+", " ", title).strip()
+    title = " ".join(title.split())
 
-    # Remove leading/trailing dots, dashes, underscores
-    title = re.sub(r"^[\.\-_\s]+|[\.\-_\s]+$", "", title)
+    # Remove leading/trailing dots, dashes, underscores (whitespace is already
+    # collapsed to single spaces, so a space is the only one left to strip)
+    title = title.strip(" .-_")
 
     # Capitalize properly
-    title = title.title()
+    title = _titlecase(title)
 
     return title or "Unknown"
+
+
+@lru_cache(maxsize=2048)
+def _titlecase(title: str) -> str:
+    """Title-case a cleaned title."""
+    return title.title()
@@ -6,8 +6,12 @@ import pytest
 
 from mediamovarr.classify import MediaType
 from mediamovarr.renamer import (
+    EpisodeInfo,
     _clean_title,
+    _parse_audiobook_name,
+    _parse_episode_info,
     _parse_movie_name,
+    _parse_music_name,
     _parse_tv_show_name,
     get_renamed_path,
 )
@@ -27,6 +31,44 @@ class TestRenamer:
         expected = Path("/media/TV Shows/The Office/Season 01")
         assert dest == expected
 
+    def test_episode_folder_renaming(self, tmp_path):
+        """Test TV episode folder with a single video file."""
+        config = {"dest_dir": "/media"}
+
+        # Single video file: treated as an episode
+        episode = tmp_path / "Breaking Bad S05E03 Hazard Pay"
+        episode.mkdir()
+        (episode / "breaking.bad.s05e03.mkv").touch()
+        (episode / "breaking.bad.s05e03.nfo").touch()
+
+        dest = get_renamed_path(episode, MediaType.TV, config)
+
+        expected = Path(
+            "/media/TV Shows/Breaking Bad/Season 05/Breaking.Bad.S05E03.Hazard.Pay.mkv"
+        )
+        assert dest == expected
+
+        # Multiple video files: treated as a season folder
+        (episode / "sample.mp4").touch()
+
+        dest = get_renamed_path(episode, MediaType.TV, config)
+
+        assert dest == Path("/media/TV Shows/Breaking Bad/Season 05")
+
+    def test_episode_file_renaming(self, tmp_path):
+        """Test TV episode given as a single video file."""
+        config = {"dest_dir": "/media"}
+
+        episode = tmp_path / "Breaking Bad S05E03 [720p].mkv"
+        episode.touch()
+
+        dest = get_renamed_path(episode, MediaType.TV, config)
+
+        expected = Path(
+            "/media/TV Shows/Breaking Bad/Season 05/Breaking.Bad.S05E03.mkv"
+        )
+        assert dest == expected
+
     def test_movie_renaming(self):
         """Test movie renaming."""
         config = {"dest_dir": "/media"}
@@ -86,6 +128,42 @@ class TestRenamer:
             result = _parse_movie_name(input_name)
             assert result == expected, f"Failed for: {input_name}"
 
+    def test_music_parsing(self):
+        """Test music name parsing."""
+        test_cases = [
+            ("The Beatles - Abbey Road", ("The Beatles", "Abbey Road")),
+            ("Artist_Album", ("Artist", "Album")),
+            ("Album", (None, "Album")),
+        ]
+
+        for input_name, expected in test_cases:
+            result = _parse_music_name(input_name)
+            assert result == expected, f"Failed for: {input_name}"
+
+    def test_audiobook_parsing(self):
+        """Test audiobook name parsing."""
+        test_cases = [
+            ("Stephen King - The Stand", ("Stephen King", "The Stand")),
+            ("The Stand by Stephen King", ("Stephen King", "The Stand")),
+            ("The Stand", (None, "The Stand")),
+        ]
+
+        for input_name, expected in test_cases:
+            result = _parse_audiobook_name(input_name)
+            assert result == expected, f"Failed for: {input_name}"
+
+    def test_episode_info_parsing(self):
+        """Test episode info parsing."""
+        test_cases = [
+            ("Show S01E02 The Pilot [x264]", (1, 2, "The Pilot")),
+            ("Lost 4x02", (4, 2, None)),
+            ("Some Random Movie", (None, None, None)),
+        ]
+
+        for filename, expected in test_cases:
+            result = _parse_episode_info(filename)
+            assert result == EpisodeInfo(*expected), f"Failed for: {filename}"
+
     def test_title_cleaning(self):
         """Test title cleaning."""
         test_cases = [